@@ -1,146 +1,577 @@
 import sys
 import os
-import json
 import re
-import io
 import mimetypes
 import uuid
 import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
-from collections import defaultdict
+from datetime import datetime
+from collections import Counter
+from functools import lru_cache, partial
 from typing import List, Tuple
 
 import click
+import orjson
 import requests
-import boto3
-import geopandas as gpd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
+import shapely
 from dotenv import load_dotenv
 from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
 from shapely.geometry import shape
-
-from generate_aoi import start_aoi_server
+from shapely.strtree import STRtree
 
 # Load environment variables
 load_dotenv()
 
 console = Console()
-ORDERS_LOG_FILE = Path("orders.json")
+ORDERS_LOG_FILE = Path("orders.jsonl")
+LEGACY_ORDERS_LOG_FILE = Path("orders.json")
 API_URL = "https://api.planet.com/basemaps/v1/mosaics"
+BASEMAPS_PAGE_SIZE = 250
+SEARCH_URL = "https://api.planet.com/data/v1/quick-search"
+SEARCH_CACHE_DIR = Path(".search_cache")
+SEARCH_CACHE_TTL = 6 * 60 * 60  # seconds a cached quick-search result stays valid
+JSON_HEADERS = {"Content-Type": "application/json"}
 MIN_COV_PCT = 98.0
+# GeoJSON "crs" names that mean plain lon/lat, safe to read without GeoPandas
+WGS84_CRS_NAMES = {"urn:ogc:def:crs:OGC:1.3:CRS84", "urn:ogc:def:crs:EPSG::4326", "EPSG:4326"}
 
-# Initialize S3 client
-s3 = boto3.client(
-    's3',
-    aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-    aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY")
-)
 S3_BUCKET = "flowzero"
+MAX_TRANSFER_WORKERS = 16
+S3_PART_CONCURRENCY = 4  # multipart upload threads per transferred file
+MAX_ORDER_WORKERS = 4  # default batch-submit concurrency, kept low for Planet rate limits
+MAX_STATUS_WORKERS = 8  # batch-check-status orders checked in parallel
+
+# (connect, read) seconds for every request, so a stalled connection fails
+# instead of hanging the CLI; the read timeout applies per chunk when streaming
+REQUEST_TIMEOUT = (10, 60)
+# Order POSTs are not retried, and Planet can be slow to accept large orders,
+# so they get a longer read timeout than searches and downloads
+ORDER_REQUEST_TIMEOUT = (10, 300)
+
+# Shared HTTP session: keeps Planet/S3 connections alive across calls and
+# retries idempotent requests on throttling or transient server errors
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False
+    )
+))
+
+# boto3 and geopandas are imported where they are used so that `--help` and
+# commands that never touch S3 or shapefiles don't pay their import cost.
+
+@lru_cache(maxsize=None)
+def get_s3_client():
+    """
+    Create the S3 client on first use and reuse it afterwards.
+
+    botocore's default pool of 10 connections would serialize the transfer
+    workers, so it is sized for every worker uploading all of its parts at once.
+    """
+    import boto3
+    from botocore.config import Config
+    return boto3.client(
+        's3',
+        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+        config=Config(
+            max_pool_connections=MAX_TRANSFER_WORKERS * S3_PART_CONCURRENCY,
+            retries={"max_attempts": 5, "mode": "standard"},
+            tcp_keepalive=True
+        )
+    )
+
+
+@lru_cache(maxsize=None)
+def get_s3_transfer_config():
+    """
+    Multipart settings for uploading Planet downloads to S3.
+
+    boto3 holds each in-flight part in memory, so chunksize * max_concurrency
+    (32 MB) bounds the buffered bytes per transfer worker.
+    """
+    from boto3.s3.transfer import TransferConfig
+    return TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        multipart_chunksize=8 * 1024 * 1024,
+        max_concurrency=S3_PART_CONCURRENCY,
+        use_threads=True
+    )
+
+# Precompiled patterns for AOI names and Planet product filenames
+# "DrySpy_AOI_" / "AOI_" prefix and a case-insensitive compass suffix, stripped in one pass
+AOI_AFFIX_RE = re.compile(r"^(?:DrySpy_)?AOI_|(?i:_(?:central|north|south|east|west))$")
+# Acquisition date (YYYYMMDD) and scene id from a Planet product filename in one pass
+FILENAME_RE = re.compile(r"(\d{4})(\d{2})(\d{2})_(?:(\w+)_)?")
+# submit_single_order errors meaning "nothing to order" rather than a failure
+NO_SCENES_RE = re.compile(r"No (?:cloud-free|full-coverage)")
 
 # --- Utility Functions ---
 
+@lru_cache(maxsize=4096)
 def normalize_aoi_name(raw_name: str) -> str:
     '''Normalize AOI name by removing prefixes and suffixes.'''
-    cleaned = re.sub(r"^(DrySpy_)?AOI_", "", raw_name)
-    cleaned = re.sub(r"_(central|north|south|east|west)$", "", cleaned, flags=re.IGNORECASE)
-    return cleaned
+    return AOI_AFFIX_RE.sub("", raw_name)
+
+ORDERS_LOG_LOCK = threading.Lock()
+
 
 def log_order(order_data):
-    """Append an order log entry with metadata to orders.json."""
+    """Append an order log entry with metadata to orders.jsonl (one JSON object per line)."""
     entry = order_data.copy()
     entry["timestamp"] = datetime.now().isoformat()
-    if ORDERS_LOG_FILE.exists():
-        try:
-            with ORDERS_LOG_FILE.open("r") as f:
-                orders = json.load(f)
-        except json.JSONDecodeError:
-            orders = []
-    else:
-        orders = []
-    orders.append(entry)
-    with ORDERS_LOG_FILE.open("w") as f:
-        json.dump(orders, f, indent=2)
+    with ORDERS_LOG_LOCK, ORDERS_LOG_FILE.open("ab") as f:
+        f.write(orjson.dumps(entry, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE))
+
+
+def migrate_orders_log():
+    """One-time conversion of a legacy orders.json array into orders.jsonl."""
+    if ORDERS_LOG_FILE.exists() or not LEGACY_ORDERS_LOG_FILE.exists():
+        return
+    try:
+        orders = orjson.loads(LEGACY_ORDERS_LOG_FILE.read_bytes())
+    except orjson.JSONDecodeError:
+        console.print(f"[yellow]⚠️ Could not migrate {LEGACY_ORDERS_LOG_FILE}: invalid JSON[/yellow]")
+        return
+    # Write to a temp file and rename so an interrupted migration can't leave a
+    # truncated orders.jsonl behind (its existence is what marks migration done)
+    tmp_path = ORDERS_LOG_FILE.with_suffix(".jsonl.tmp")
+    with tmp_path.open("wb") as f:
+        for order in orders:
+            f.write(orjson.dumps(order, option=orjson.OPT_APPEND_NEWLINE))
+    os.replace(tmp_path, ORDERS_LOG_FILE)
+    console.print(f"[dim]Migrated {len(orders)} orders from {LEGACY_ORDERS_LOG_FILE} to {ORDERS_LOG_FILE}[/dim]")
+
+
+def iter_orders():
+    """Yield order log entries from orders.jsonl one at a time."""
+    if not ORDERS_LOG_FILE.exists():
+        return
+    with ORDERS_LOG_FILE.open("rb") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield orjson.loads(line)
 
 
 def s3_key_exists(bucket: str, key: str) -> bool:
-    """Check if a key exists in S3."""
+    """Check if a single key exists in S3."""
+    from botocore.exceptions import ClientError
     try:
-        s3.head_object(Bucket=bucket, Key=key)
+        get_s3_client().head_object(Bucket=bucket, Key=key)
         return True
-    except:
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+            return False
+        raise
+
+
+def list_existing_keys(bucket: str, prefix: str) -> set:
+    """
+    Return every key under `prefix` in one paginated listing.
+
+    One LIST call covers up to 1000 keys, so checking a whole order's
+    files against this set is far cheaper than a HEAD request per file.
+    """
+    paginator = get_s3_client().get_paginator("list_objects_v2")
+    return {
+        obj["Key"]
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix)
+        for obj in page.get("Contents", [])
+    }
+
+
+def upload_response_to_s3(r: requests.Response, s3_key: str):
+    """
+    Stream a download straight into S3 with a multipart transfer.
+
+    boto3 reads the non-seekable body one part at a time and uploads parts
+    concurrently while the rest is still downloading, so at most
+    chunksize * max_concurrency bytes are buffered per transfer.
+    """
+    r.raw.decode_content = True
+    get_s3_client().upload_fileobj(
+        r.raw,
+        S3_BUCKET,
+        s3_key,
+        Config=get_s3_transfer_config()
+    )
+
+
+def stream_to_s3(url: str, s3_key: str) -> bool:
+    """Stream a downloaded file straight into S3. Returns True on success."""
+    try:
+        with SESSION.get(url, stream=True, timeout=REQUEST_TIMEOUT) as r:
+            if r.status_code != 200:
+                console.print(f"[❌] Failed to download file for s3://{S3_BUCKET}/{s3_key}: {r.status_code}", style="bold red")
+                return False
+            upload_response_to_s3(r, s3_key)
+            return True
+    except Exception as e:
+        console.print(f"[❌] Error uploading to s3://{S3_BUCKET}/{s3_key}: {str(e)}", style="bold red")
+        return False
+
+
+def stream_to_file(url: str, local_path: Path) -> bool:
+    """
+    Stream a downloaded file to a local path in 1 MB chunks. Returns True on success.
+
+    The parent directory must already exist; callers create each destination
+    directory once rather than once per file.
+    """
+    try:
+        with SESSION.get(url, stream=True, timeout=REQUEST_TIMEOUT) as r:
+            if r.status_code != 200:
+                console.print(f"[❌] Failed to download file for {local_path}: {r.status_code}", style="bold red")
+                return False
+            with open(local_path, 'wb') as f:
+                for chunk in r.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
+            return True
+    except Exception as e:
+        console.print(f"[❌] Error saving {local_path}: {str(e)}", style="bold red")
         return False
 
 
+def dissolve_aoi(gdf):
+    """Collapse all AOI features into one geometry, skipping the union for single-feature files."""
+    geoms = np.asarray(gdf.geometry.array)
+    if len(geoms) == 1:
+        return geoms[0]
+    return shapely.union_all(geoms)
+
+
+def load_aoi(path):
+    """
+    Load an AOI file as a single WGS84 geometry.
+
+    Plain lon/lat GeoJSON is parsed directly with json + Shapely; Shapefiles and
+    GeoJSON declaring another CRS go through GeoPandas and are reprojected.
+    Raises ValueError if the file contains no geometry.
+    """
+    path = Path(path)
+    if path.suffix.lower() in (".geojson", ".json"):
+        obj = orjson.loads(path.read_bytes())
+        crs_name = ((obj.get("crs") or {}).get("properties") or {}).get("name")
+        if crs_name is None or crs_name in WGS84_CRS_NAMES:
+            if obj.get("type") == "FeatureCollection":
+                geoms = [shape(f["geometry"]) for f in obj.get("features") or [] if f.get("geometry")]
+            elif obj.get("type") == "Feature":
+                geoms = [shape(obj["geometry"])] if obj.get("geometry") else []
+            else:
+                geoms = [shape(obj)]
+            if not geoms:
+                raise ValueError(f"No geometry found in AOI file {path}")
+            geom = geoms[0] if len(geoms) == 1 else shapely.union_all(geoms)
+            if geom.is_empty:
+                raise ValueError(f"AOI geometry in {path} is empty")
+            return geom
+
+    import geopandas as gpd
+    gdf = gpd.read_file(path)
+    gdf = gdf[gdf.geometry.notna()]
+    if gdf.empty:
+        raise ValueError(f"No geometry found in AOI file {path}")
+    gdf = gdf.to_crs(epsg=4326)
+    geom = dissolve_aoi(gdf)
+    if geom.is_empty:
+        raise ValueError(f"AOI geometry in {path} is empty")
+    return geom
+
+
+def compute_area_sqkm(geom) -> float:
+    """
+    Geodesic area of a lon/lat geometry in sq km, computed on the WGS84 ellipsoid.
+
+    Works directly on the WGS84 geometry, so no reprojection (or GeoPandas) is
+    needed. The geometry is normalized first so every ring has the same
+    orientation and multipolygon parts can't cancel each other's signed area.
+    """
+    from pyproj import Geod
+    area_m2, _ = Geod(ellps="WGS84").geometry_area_perimeter(shapely.normalize(geom))
+    return abs(area_m2) / 1e6  # m² → km²
+
+
+def compute_coverage(features: List[dict], aoi_geom, min_pct: float = 0.0) -> np.ndarray:
+    """
+    Compute the percentage of the AOI covered by each scene footprint.
+
+    Scenes are indexed in an STRtree so bounding-box pruning discards disjoint
+    footprints, scenes that fully cover the AOI are scored 100% without an
+    intersection, and only partial overlaps go through the vectorized GEOS
+    intersection. When min_pct is given, partial overlaps whose bounding-box
+    overlap with the AOI is already too small to reach it are scored 0
+    without an intersection either.
+    """
+    # GEOS parses the footprints from GeoJSON bytes in one vectorized call
+    geoms = shapely.from_geojson([orjson.dumps(f["geometry"]) for f in features])
+    coverage = np.zeros(len(geoms))
+    # The AOI is not prepared in place: batch-submit date chunks share one AOI
+    # object across threads, and GEOS prepared geometries aren't thread-safe.
+    # STRtree.query prepares the query geometry for each call on its own.
+    aoi_area = aoi_geom.area
+    tree = STRtree(geoms)
+    candidates = tree.query(aoi_geom, predicate="intersects")
+    full = tree.query(aoi_geom, predicate="covered_by")
+    coverage[full] = 100.0
+    partial = np.setdiff1d(candidates, full)
+    if partial.size and min_pct > 0:
+        # The scene/AOI intersection lies inside the overlap of their bounding
+        # boxes, so that overlap's area is an upper bound on the coverage
+        bounds = shapely.bounds(geoms[partial])
+        minx, miny, maxx, maxy = aoi_geom.bounds
+        overlap_w = np.clip(np.minimum(bounds[:, 2], maxx) - np.maximum(bounds[:, 0], minx), 0, None)
+        overlap_h = np.clip(np.minimum(bounds[:, 3], maxy) - np.maximum(bounds[:, 1], miny), 0, None)
+        partial = partial[overlap_w * overlap_h / aoi_area * 100 >= min_pct]
+    if partial.size:
+        intersect_area = shapely.area(shapely.intersection(geoms[partial], aoi_geom))
+        coverage[partial] = (intersect_area / aoi_area) * 100
+    return coverage
+
+
+def run_transfers(jobs: List[Tuple[str, object]], transfer=stream_to_s3, verbose: bool = False) -> list:
+    """
+    Run (url, target) transfers concurrently behind a single progress bar.
+
+    `transfer` is stream_to_s3 (target is an S3 key) or stream_to_file (target
+    is a local path). Failures are always reported; each completed file is
+    only listed when verbose. Returns the targets that failed so they can be
+    reported or retried.
+    """
+    if not jobs:
+        return []
+    label = (lambda t: f"s3://{S3_BUCKET}/{t}") if transfer is stream_to_s3 else str
+    results = {}
+    with Progress(
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        console=console
+    ) as progress:
+        task = progress.add_task("Uploading" if transfer is stream_to_s3 else "Downloading", total=len(jobs))
+        with ThreadPoolExecutor(max_workers=MAX_TRANSFER_WORKERS) as pool:
+            futures = {pool.submit(transfer, url, target): i for i, (url, target) in enumerate(jobs)}
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                if verbose and results[i]:
+                    console.print(f"[✅] Saved: {label(jobs[i][1])}")
+                progress.advance(task)
+    failed = [target for i, (_, target) in enumerate(jobs) if not results[i]]
+    if failed:
+        console.print(f"[❌] {len(failed)} of {len(jobs)} transfers failed:", style="bold red")
+        for target in failed:
+            console.print(f"    - {label(target)}")
+    else:
+        console.print(f"[✅] Transferred {len(jobs)} files")
+    return failed
+
+
+def slim_feature(feature: dict) -> dict:
+    """Keep only the parts of a quick-search feature the CLI reads: id, footprint, acquired date and thumbnail."""
+    return {
+        "id": feature["id"],
+        "geometry": feature["geometry"],
+        "properties": {"acquired": feature["properties"]["acquired"]},
+        "_links": {"thumbnail": feature.get("_links", {}).get("thumbnail")}
+    }
+
+
+def post_search(search_url: str, search_payload: dict, api_key: str, search_headers: dict, attempts: int = 5) -> requests.Response:
+    """
+    POST the first quick-search page, waiting out 429 throttling.
+
+    The session only retries idempotent methods (order POSTs must never be
+    replayed), so the search POST honours Retry-After itself.
+    """
+    body = orjson.dumps(search_payload)
+    for attempt in range(attempts):
+        response = SESSION.post(search_url, data=body, auth=(api_key, ""), headers=search_headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code != 429 or attempt == attempts - 1:
+            return response
+        retry_after = response.headers.get("Retry-After", "")
+        time.sleep(float(retry_after) if retry_after.isdigit() else 2 ** attempt)
+
+
 def fetch_all_search_results(search_url: str, search_payload: dict, api_key: str, search_headers: dict) -> List[dict]:
     """
     Fetch all search results from Planet API, handling pagination.
     
     Follows Planet API pagination pattern: check _links["_next"] until it's gone.
+    The next page is requested in the background as soon as its link is known,
+    while the current page is trimmed with slim_feature, so the dozens of
+    unused properties per scene are dropped instead of held for the whole search.
+    Throttling is handled by the session's Retry (which honours Retry-After)
+    rather than a fixed delay between pages.
     Returns a list of all features from all pages.
     """
     all_features = []
-    current_url = search_url
-    current_payload = search_payload
-    is_first_request = True
-    
-    while True:
-        if is_first_request:
-            # First request uses POST with payload
-            response = requests.post(current_url, json=current_payload, auth=(api_key, ""), headers=search_headers)
-            is_first_request = False
-        else:
-            # Subsequent pagination requests use GET
-            response = requests.get(current_url, auth=(api_key, ""), headers=search_headers)
-        
-        if response.status_code != 200:
-            raise Exception(f"Search failed: {response.status_code} - {response.text}")
-        
-        data = response.json()
-        features = data.get("features", [])
-        all_features.extend(features)
-        
-        # Follow pagination - Planet API uses "_next" (with underscore) in _links
-        # Check if _next exists and is not None (JSON null becomes Python None)
-        links = data.get("_links", {})
-        next_url = links.get("_next")  # Returns None if missing or null
-        
-        if next_url:  # Only proceed if next_url is a valid non-None value
-            current_url = next_url
-            # Small delay to be respectful to API
-            time.sleep(0.5)
-        else:
-            # No more pages (_next is None, missing, or empty)
-            break
-    
+
+    with ThreadPoolExecutor(max_workers=1) as prefetch:
+        # First request uses POST with payload, pagination requests use GET
+        future = prefetch.submit(post_search, search_url, search_payload, api_key, search_headers)
+        while future:
+            response = future.result()
+            if response.status_code != 200:
+                raise Exception(f"Search failed: {response.status_code} - {response.text}")
+
+            data = orjson.loads(response.content)
+
+            # Follow pagination - Planet API uses "_next" (with underscore) in _links
+            # (JSON null becomes Python None, which ends the loop)
+            next_url = data.get("_links", {}).get("_next")
+            future = prefetch.submit(SESSION.get, next_url, auth=(api_key, ""), headers=search_headers, timeout=REQUEST_TIMEOUT) if next_url else None
+
+            all_features.extend(slim_feature(f) for f in data.get("features", []))
+
     return all_features
 
-def extract_date_from_filename(filename):
-    """Extract the acquisition date from Planet product filename."""
-    pattern = r"(\d{4})(\d{2})(\d{2})_"
-    match = re.search(pattern, filename)
-    if match:
-        year, month, day = match.groups()
-        return f"{year}_{month}_{day}"
-    return None
-
-def extract_scene_id(filename):
-    """Extract scene ID from Planet product filename."""
-    pattern = r"\d{8}_(\w+)_"
-    match = re.search(pattern, filename)
-    if match:
-        return match.group(1)
-    return None
-
-def get_week_start_date(date_str):
-    """Get start of week (Sunday) for a given date string (YYYY_MM_DD)."""
-    year, month, day = map(int, date_str.split('_'))
-    date_obj = datetime(year, month, day)
-    days_to_sunday = date_obj.weekday() + 1
-    if days_to_sunday == 7:
-        return date_str
-    sunday = date_obj - timedelta(days=days_to_sunday)
-    return sunday.strftime('%Y_%m_%d')
+def build_search_payload(aoi_geojson: dict, start_date: str, end_date: str, product_bundle: str) -> dict:
+    """Build the PSScene quick-search payload (cloud-free, standard quality) for an AOI and date range."""
+    return {
+        "item_types": ["PSScene"],
+        "filter": {
+            "type": "AndFilter",
+            "config": [
+                {"type": "GeometryFilter", "field_name": "geometry", "config": aoi_geojson},
+                {"type": "DateRangeFilter", "field_name": "acquired", "config": {"gte": f"{start_date}T00:00:00Z", "lte": f"{end_date}T23:59:59Z"}},
+                {"type": "RangeFilter", "field_name": "cloud_cover", "config": {"lte": 0.0}},
+                {"type": "AssetFilter", "config": [product_bundle]},
+                {"type":"StringInFilter", "field_name":"quality_category", "config":["standard"]}
+            ]
+        }
+    }
+
+
+def planet_quick_search(aoi_geojson: dict, start_date: str, end_date: str, product_bundle: str, api_key: str, use_cache: bool = True) -> List[dict]:
+    """
+    Run a PSScene quick search and return every matching feature across all pages.
+
+    Results are cached on disk for SEARCH_CACHE_TTL, keyed by the search payload
+    and API key, so re-running a command (e.g. a batch that failed halfway)
+    doesn't repeat every search. With use_cache=False the cache is not read,
+    but the fresh result still replaces the cached one.
+    """
+    payload = build_search_payload(aoi_geojson, start_date, end_date, product_bundle)
+    key = hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS) + api_key.encode()).hexdigest()
+    cache_path = SEARCH_CACHE_DIR / f"{key}.json"
+
+    if use_cache and cache_path.exists() and time.time() - cache_path.stat().st_mtime < SEARCH_CACHE_TTL:
+        try:
+            return orjson.loads(cache_path.read_bytes())
+        except orjson.JSONDecodeError:
+            pass  # unreadable cache entry, fall through and search again
+
+    features = fetch_all_search_results(SEARCH_URL, payload, api_key, JSON_HEADERS)
+    SEARCH_CACHE_DIR.mkdir(exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+    tmp_path.write_bytes(orjson.dumps(features))
+    os.replace(tmp_path, cache_path)
+    return features
+
+
+def select_best_scenes(features: List[dict], aoi_geom, cadence: str, log_skipped: bool = False) -> List[tuple]:
+    """
+    Pick the best scene per cadence interval.
+
+    Scenes below MIN_COV_PCT coverage are dropped; within each interval the
+    highest coverage wins, ties going to the earliest date.
+
+    Returns a list of (feature, coverage_pct, date) tuples.
+    """
+    # Exact coverage is only needed for every scene when reporting the skipped ones
+    coverages = compute_coverage(features, aoi_geom, min_pct=0.0 if log_skipped else MIN_COV_PCT)
+    keep = coverages >= MIN_COV_PCT
+    if log_skipped:
+        for i in np.flatnonzero(~keep):
+            console.print(f"[dim]Skipping {features[i]['id']}: only {coverages[i]:.2f}% coverage[/dim]")
+
+    # Only scenes that pass the coverage mask are dated, keyed and grouped
+    idx = np.flatnonzero(keep)
+    kept = [features[i] for i in idx]
+    dates = parse_acquired_dates(kept)
+    interval_keys = get_interval_keys(dates, cadence)
+    # Single pass keeping the best (highest coverage, then earliest) per interval
+    best = {}
+    for feature, coverage_pct, date, key in zip(kept, coverages[idx].tolist(), dates.tolist(), interval_keys):
+        rank = (-coverage_pct, date)
+        current = best.get(key)
+        if current is None or rank < current[0]:
+            best[key] = (rank, feature, coverage_pct, date)
+    return [(f, coverage_pct, date) for _, f, coverage_pct, date in best.values()]
+
+
+def select_weekly_images(download_links: List[dict]) -> Tuple[dict, int, List[str]]:
+    """
+    Pick one GeoTIFF per week (weeks start on Sunday) from a PSScope order's results.
+
+    Builds a single DataFrame from the download links and does the filename
+    filtering, date/scene-id extraction and week bucketing as column operations.
+
+    Returns (weeks, image_count, undated_filenames) where weeks maps each
+    week_start (YYYY_MM_DD) to the earliest image of that week, in week order.
+    """
+    import pandas as pd
+
+    df = pd.DataFrame(download_links, columns=["name", "location", "length"])
+    df["filename"] = df["name"].fillna("").str.rsplit("/", n=1).str[-1]
+    df = df.drop_duplicates("filename")
+    lower = df["filename"].str.lower()
+    df = df[lower.str.endswith(".tif") & ~lower.str.contains("udm", regex=False)]
+
+    parts = df["filename"].str.extract(FILENAME_RE)
+    dates = pd.to_datetime(parts[0] + parts[1] + parts[2], format="%Y%m%d", errors="coerce")
+    undated = df["filename"][dates.isna()].tolist()
+    df = df[dates.notna()].assign(date_obj=dates[dates.notna()], scene_id=parts[3][dates.notna()])
+
+    df["date"] = df["date_obj"].dt.strftime("%Y_%m_%d")
+    week_start = df["date_obj"] - pd.to_timedelta((df["date_obj"].dt.dayofweek + 1) % 7, unit="D")
+    df["week_start"] = week_start.dt.strftime("%Y_%m_%d")
+    df["scene_id"] = df["scene_id"].fillna("unknown")
+    df["size"] = df["length"].fillna(0)
+
+    best = df.sort_values(["week_start", "date"], kind="stable").drop_duplicates("week_start")
+    weeks = {
+        row.week_start: {
+            'filename': row.filename,
+            'date': row.date,
+            'week_start': row.week_start,
+            'scene_id': row.scene_id,
+            'url': row.location,
+            'size': int(row.size)
+        }
+        for row in best.itertuples(index=False)
+    }
+    return weeks, len(df), undated
+
+
+def parse_acquired_dates(features: List[dict]) -> np.ndarray:
+    """Parse the acquisition day of every feature into a datetime64[D] array."""
+    return np.array([f["properties"]["acquired"][:10] for f in features], dtype="datetime64[D]")
+
+
+def get_interval_keys(dates: np.ndarray, cadence: str) -> np.ndarray:
+    """Map datetime64[D] dates to cadence interval keys (day, week-start Sunday, or month)."""
+    if cadence == "weekly":
+        # 1970-01-01 was a Thursday, so (days + 4) % 7 is the offset back to Sunday
+        offsets = (dates.astype("int64") + 4) % 7
+        dates = dates - offsets.astype("timedelta64[D]")
+    elif cadence == "monthly":
+        dates = dates.astype("datetime64[M]")
+    return dates.astype(str)
 
 
 def subdivide_date_range(start_date: str, end_date: str, max_months: int = 6) -> List[Tuple[str, str]]:
@@ -155,27 +586,16 @@ def subdivide_date_range(start_date: str, end_date: str, max_months: int = 6) ->
     Returns:
         List of (start_date, end_date) tuples for each chunk
     """
-    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-    
-    chunks = []
-    current_start = start_dt
-    
-    while current_start <= end_dt:
-        # Calculate chunk end: either max_months from start or the overall end date
-        chunk_end = current_start + relativedelta(months=max_months) - timedelta(days=1)
-        if chunk_end > end_dt:
-            chunk_end = end_dt
-        
-        chunks.append((
-            current_start.strftime("%Y-%m-%d"),
-            chunk_end.strftime("%Y-%m-%d")
-        ))
-        
-        # Move to next chunk
-        current_start = chunk_end + timedelta(days=1)
-    
-    return chunks
+    import pandas as pd
+
+    step = pd.DateOffset(months=max_months)
+    end_ts = pd.Timestamp(end_date)
+    # Chunk starts step max_months from the start; each chunk ends the day
+    # before the next one starts, clipped to the overall end date
+    starts = pd.date_range(start_date, end_ts, freq=step)
+    ends = starts + step - pd.Timedelta(days=1)
+    ends = ends.where(ends <= end_ts, end_ts)
+    return list(zip(starts.strftime("%Y-%m-%d"), ends.strftime("%Y-%m-%d")))
 
 
 def submit_single_order(
@@ -191,73 +611,24 @@ def submit_single_order(
     cadence: str,
     api_key: str,
     dry_run: bool = False,
-    batch_id: str = None
+    batch_id: str = None,
+    use_cache: bool = True
 ) -> dict:
     """
     Submit a single order to Planet API.
     
     Returns dict with order info or error details.
     """
-    start_date_iso = f"{start_date}T00:00:00Z"
-    end_date_iso = f"{end_date}T23:59:59Z"
-    
-    # Perform scene search
-    search_url = "https://api.planet.com/data/v1/quick-search"
-    search_payload = {
-        "item_types": ["PSScene"],
-        "filter": {
-            "type": "AndFilter",
-            "config": [
-                {"type": "GeometryFilter", "field_name": "geometry", "config": aoi_geojson},
-                {"type": "DateRangeFilter", "field_name": "acquired", "config": {"gte": start_date_iso, "lte": end_date_iso}},
-                {"type": "RangeFilter", "field_name": "cloud_cover", "config": {"lte": 0.0}},
-                {"type": "AssetFilter", "config": [product_bundle]},
-                {"type":"StringInFilter", "field_name":"quality_category", "config":["standard"]}
-            ]
-        }
-    }
-    
-    search_headers = {"Content-Type": "application/json"}
-    
     # Fetch all results with pagination
     try:
-        features = fetch_all_search_results(search_url, search_payload, api_key, search_headers)
+        features = planet_quick_search(aoi_geojson, start_date, end_date, product_bundle, api_key, use_cache)
     except Exception as e:
         return {"success": False, "error": str(e)}
     
     if not features:
         return {"success": False, "error": "No cloud-free scenes found", "scenes_found": 0}
     
-    def get_interval_key(date_obj):
-        if cadence == "daily":
-            return date_obj.strftime("%Y-%m-%d")
-        elif cadence == "weekly":
-            sunday = date_obj - timedelta(days=date_obj.weekday() + 1 if date_obj.weekday() != 6 else 0)
-            return sunday.strftime("%Y-%m-%d")
-        elif cadence == "monthly":
-            return date_obj.strftime("%Y-%m")
-    
-    scene_groups = defaultdict(list)
-    
-    for feature in features:
-        props = feature["properties"]
-        geom = shape(feature["geometry"])
-        intersect_area = geom.intersection(aoi_geom).area
-        coverage_pct = (intersect_area / aoi_geom.area) * 100
-        if coverage_pct < MIN_COV_PCT:
-            continue
-        
-        date_str = props["acquired"][:10]
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        key = get_interval_key(date_obj)
-        scene_groups[key].append((coverage_pct, date_obj, feature))
-    
-    # Sort each group by coverage descending, then date ascending; select first
-    selected = []
-    for group in scene_groups.values():
-        group.sort(key=lambda x: (-x[0], x[1]))  # coverage desc, date asc
-        coverage_pct, date, f = group[0]
-        selected.append((f, coverage_pct, date))
+    selected = select_best_scenes(features, aoi_geom, cadence)
     
     if not selected:
         return {"success": False, "error": "No full-coverage scenes matched filter", "scenes_found": len(features)}
@@ -297,10 +668,13 @@ def submit_single_order(
         ]
     }
     
-    response = requests.post(order_url, json=order_payload, auth=(api_key, ""), headers=search_headers)
+    try:
+        response = SESSION.post(order_url, data=orjson.dumps(order_payload), auth=(api_key, ""), headers=JSON_HEADERS, timeout=ORDER_REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        return {"success": False, "error": f"Order request failed (order may have been created): {e}"}
     
     if response.status_code == 202:
-        order_id = response.json()["id"]
+        order_id = orjson.loads(response.content)["id"]
         order_log = {
             "order_id": order_id,
             "aoi_name": gage_id,
@@ -339,13 +713,14 @@ def submit_single_order(
 @click.group()
 def cli():
     """FlowZero - River Monitoring Tool using Planet Satellite Data"""
-    pass
+    migrate_orders_log()
 
 @cli.command()
 def generate_aoi():
     """Launch interactive AOI generation web interface."""
     console.print("🌍 Launching AOI generation server...", style="bold green")
     console.print("📝 Open your browser at http://localhost:5000", style="bold blue")
+    from generate_aoi import start_aoi_server
     start_aoi_server()
 
 @cli.command()
@@ -354,6 +729,8 @@ def generate_aoi():
 def convert_shp(shp, output):
     """Convert Shapefile to GeoJSON with proper CRS handling."""
     try:
+        import geopandas as gpd
+
         output_dir = Path(output)
         output_dir.mkdir(parents=True, exist_ok=True)
         shp_path = Path(shp)
@@ -377,23 +754,15 @@ def convert_shp(shp, output):
 @click.option("--api-key", default=os.getenv("PL_API_KEY"), help="Planet API Key")
 @click.option("--bundle", default=None, help="Override bundle name to use")
 @click.option("--cadence", type=click.Choice(["daily", "weekly", "monthly"]), default="weekly", help="Scene selection cadence")
-def submit(geojson, start_date, end_date, num_bands, api_key, bundle, cadence):
+@click.option("--no-cache", is_flag=True, default=False, help="Ignore cached search results and query Planet again")
+def submit(geojson, start_date, end_date, num_bands, api_key, bundle, cadence, no_cache):
     """Submit a new PlanetScope imagery order (PSScope Scenes) with AOI clipping."""
     try:
-        from shapely.geometry import shape
-        from collections import defaultdict
-
-        start_date_iso = f"{start_date}T00:00:00Z"
-        end_date_iso = f"{end_date}T23:59:59Z"
-
-        gdf = gpd.read_file(geojson)
-        gdf = gdf.to_crs(epsg=4326)
-        aoi_geom = gdf.geometry.union_all()
+        aoi_geom = load_aoi(geojson)
         aoi = aoi_geom.__geo_interface__
 
-        gdf_equal_area = gdf.to_crs(epsg=6933)  # World Cylindrical Equal Area
-        # Compute area in sq km using equal-area CRS
-        aoi_area_sqkm = gdf_equal_area.area.sum() / 1e6  # m² → km²
+        # Geodesic area of the dissolved AOI; overlapping parts are not double counted
+        aoi_area_sqkm = compute_area_sqkm(aoi_geom)
         console.print(f"[✓] AOI area: {aoi_area_sqkm:.2f} sq km", style="bold blue")
 
         start_year = int(start_date.split('-')[0])
@@ -417,26 +786,8 @@ def submit(geojson, start_date, end_date, num_bands, api_key, bundle, cadence):
             product_bundle_order = product_bundle
         
         # Perform scene search with cadence filtering (as in search-scenes)
-        search_url = "https://api.planet.com/data/v1/quick-search"
-        search_payload = {
-            "item_types": ["PSScene"],
-            "filter": {
-                "type": "AndFilter",
-                "config": [
-                    {"type": "GeometryFilter", "field_name": "geometry", "config": aoi},
-                    {"type": "DateRangeFilter", "field_name": "acquired", "config": {"gte": start_date_iso, "lte": end_date_iso}},
-                    {"type": "RangeFilter", "field_name": "cloud_cover", "config": {"lte": 0.0}},
-                    {"type": "AssetFilter", "config": [product_bundle]},
-                    {"type":"StringInFilter", "field_name":"quality_category", "config":["standard"]}
-                ]
-            }
-        }
-
-        search_headers = {"Content-Type": "application/json"}
-        
-        # Fetch all results with pagination
         try:
-            features = fetch_all_search_results(search_url, search_payload, api_key, search_headers)
+            features = planet_quick_search(aoi, start_date, end_date, product_bundle, api_key, use_cache=not no_cache)
         except Exception as e:
             console.print(f"❌ Failed to search for scenes: {str(e)}", style="bold red")
             return
@@ -445,36 +796,7 @@ def submit(geojson, start_date, end_date, num_bands, api_key, bundle, cadence):
             console.print("[yellow]No cloud-free PlanetScope scenes found.[/yellow]")
             return
 
-        def get_interval_key(date_obj):
-            if cadence == "daily":
-                return date_obj.strftime("%Y-%m-%d")
-            elif cadence == "weekly":
-                sunday = date_obj - timedelta(days=date_obj.weekday() + 1 if date_obj.weekday() != 6 else 0)
-                return sunday.strftime("%Y-%m-%d")
-            elif cadence == "monthly":
-                return date_obj.strftime("%Y-%m")
-
-        scene_groups = defaultdict(list)
-
-        for feature in features:
-            props = feature["properties"]
-            geom = shape(feature["geometry"])
-            intersect_area = geom.intersection(aoi_geom).area
-            coverage_pct = (intersect_area / aoi_geom.area) * 100
-            if coverage_pct < MIN_COV_PCT:
-                continue
-
-            date_str = props["acquired"][:10]
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            key = get_interval_key(date_obj)
-            scene_groups[key].append((coverage_pct, date_obj, feature))
-
-        # Sort each group by coverage descending, then date ascending; select first
-        selected = []
-        for group in scene_groups.values():
-            group.sort(key=lambda x: (-x[0], x[1]))  # coverage desc, date asc
-            coverage_pct, date, f = group[0]
-            selected.append((f, coverage_pct, date))
+        selected = select_best_scenes(features, aoi_geom, cadence)
 
         if not selected:
             console.print("[yellow]No full-coverage scenes matched filter.[/yellow]")
@@ -483,7 +805,7 @@ def submit(geojson, start_date, end_date, num_bands, api_key, bundle, cadence):
         console.print(f"[green]Selected {len(selected)} best scenes ({cadence})[/green]")
         for f, cov, dt in selected:
             thumb = f["_links"].get("thumbnail")
-            console.print(f"{dt.date()} | ID: {f['id']} | Coverage: {cov:.2f}% | [link={thumb}]thumbnail[/link]")
+            console.print(f"{dt} | ID: {f['id']} | Coverage: {cov:.2f}% | [link={thumb}]thumbnail[/link]")
 
         # Print the total sqkm covered by this order and ask the user if they want to proceed
         console.print(f"[blue]Total quota used in this order: {aoi_area_sqkm * len(selected):.2f} sq km[/blue]")
@@ -507,10 +829,14 @@ def submit(geojson, start_date, end_date, num_bands, api_key, bundle, cadence):
             ]
         }
 
-        response = requests.post(order_url, json=order_payload, auth=(api_key, ""), headers=search_headers)
+        try:
+            response = SESSION.post(order_url, data=orjson.dumps(order_payload), auth=(api_key, ""), headers=JSON_HEADERS, timeout=ORDER_REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            console.print(f"❌ Order request failed (order may have been created): {e}", style="bold red")
+            sys.exit(1)
 
         if response.status_code == 202:
-            order_id = response.json()["id"]
+            order_id = orjson.loads(response.content)["id"]
             console.print(f"✅ Order submitted successfully! Order ID: {order_id}", style="bold green")
             log_order({
                 "order_id": order_id,
@@ -543,8 +869,11 @@ def order_basemap(mosaic_name, geojson, api_key):
         return
 
     if geojson:
-        gdf = gpd.read_file(geojson)
-        aoi = gdf.geometry.unary_union.__geo_interface__
+        try:
+            aoi = load_aoi(geojson).__geo_interface__
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            return
     else:
         console.print("[red]Error: A GeoJSON file must be provided.[/red]")
         return
@@ -556,9 +885,13 @@ def order_basemap(mosaic_name, geojson, api_key):
         "tools": [{"clip": {}}]
     }
 
-    response = requests.post("https://api.planet.com/compute/ops/orders/v2", json=order_payload, auth=(api_key, ""))
+    try:
+        response = SESSION.post("https://api.planet.com/compute/ops/orders/v2", data=orjson.dumps(order_payload), auth=(api_key, ""), headers=JSON_HEADERS, timeout=ORDER_REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        console.print(f"[red]Order request failed (order may have been created): {e}[/red]")
+        return
     if response.status_code == 202:
-        order_info = response.json()
+        order_info = orjson.loads(response.content)
         console.print(f"✅ Order submitted successfully! Order ID: {order_info['id']}", style="bold green")
         log_order({
             "order_id": order_info['id'],
@@ -576,15 +909,17 @@ def order_basemap(mosaic_name, geojson, api_key):
 @cli.command()
 @click.argument("order_id")
 @click.option("--api-key", default=os.getenv("PL_API_KEY"), help="Planet API Key")
-def check_order_status(order_id, api_key):
+@click.option("--verbose", is_flag=True, default=False, help="List every file as it is queued and saved")
+def check_order_status(order_id, api_key, verbose):
     """Check order status and upload to S3 if completed."""
-    response = requests.get(f"https://api.planet.com/compute/ops/orders/v2/{order_id}", auth=(api_key, ""))
+    response = SESSION.get(f"https://api.planet.com/compute/ops/orders/v2/{order_id}", auth=(api_key, ""), timeout=REQUEST_TIMEOUT)
 
     if response.status_code != 200:
         console.print(f"[❌] Error checking order status: {response.text}", style="bold red")
         return
 
-    order_info = response.json()
+    order_info = orjson.loads(response.content)
+    order_info_raw = response.content  # uploaded as-is as metadata.json
     order_state = order_info["state"]
     console.print(f"[✅] Order Status: {order_state}")
 
@@ -616,19 +951,18 @@ def check_order_status(order_id, api_key):
     product_bundle = None
 
     if ORDERS_LOG_FILE.exists():
-        with open(ORDERS_LOG_FILE, "r") as f:
-            try:
-                orders = json.load(f)
-                match = next((o for o in orders if o["order_id"] == order_id), {})
-                aoi_name_raw = match.get("aoi_name", "UnknownAOI")
-                aoi_name = normalize_aoi_name(aoi_name_raw)
-                mosaic_name = match.get("mosaic_name", "unknown_mosaic")
-                order_type = match.get("order_type", "Unknown")
-                num_bands = match.get("num_bands", "four_bands")
-                product_bundle = match.get("product_bundle")
-                console.print(f"[✅] Found order metadata: AOI={aoi_name}, Type={order_type}, Bundle={product_bundle}", style="bold green")
-            except Exception as e:
-                console.print(f"[yellow]⚠️ Could not read orders.json: {e}[/yellow]")
+        try:
+            # Scan line by line and stop at the first match
+            match = next((o for o in iter_orders() if o["order_id"] == order_id), {})
+            aoi_name_raw = match.get("aoi_name", "UnknownAOI")
+            aoi_name = normalize_aoi_name(aoi_name_raw)
+            mosaic_name = match.get("mosaic_name", "unknown_mosaic")
+            order_type = match.get("order_type", "Unknown")
+            num_bands = match.get("num_bands", "four_bands")
+            product_bundle = match.get("product_bundle")
+            console.print(f"[✅] Found order metadata: AOI={aoi_name}, Type={order_type}, Bundle={product_bundle}", style="bold green")
+        except Exception as e:
+            console.print(f"[yellow]⚠️ Could not read {ORDERS_LOG_FILE}: {e}[/yellow]")
 
     is_basemap = "source_type" in order_info and order_info["source_type"] == "basemaps"
 
@@ -639,55 +973,19 @@ def check_order_status(order_id, api_key):
 
     if order_type == "PSScope" and num_bands == "four_bands":
         console.print(f"[🔍] Processing PSScope Order - Organizing by week...")
-        image_metadata = []
-        processed_filenames = set()
-        for link in download_links:
-            filename = Path(link.get("name", "")).name
-            if filename in processed_filenames:
-                continue
-            processed_filenames.add(filename)
-            if not filename.lower().endswith('.tif') or 'udm' in filename.lower() or filename.lower().endswith('.xml'):
-                continue
-            date_str = extract_date_from_filename(filename)
-            if not date_str:
-                console.print(f"[yellow]⚠️ Could not extract date from filename: {filename}[/yellow]")
-                continue
-            week_start = get_week_start_date(date_str)
-            scene_id = extract_scene_id(filename) or "unknown"
-            cloud_cover = 0
-            image_metadata.append({
-                'filename': filename,
-                'date': date_str,
-                'week_start': week_start, 
-                'scene_id': scene_id,
-                'cloud_cover': cloud_cover,
-                'url': link.get('location'),
-                'size': link.get('length', 0)
-            })
-        weeks = {}
-        for img in sorted(image_metadata, key=lambda x: (x['week_start'], x['cloud_cover'], x['date'])):
-            week = img['week_start']
-            if week not in weeks:
-                weeks[week] = img
-        console.print(f"[✅] Found {len(image_metadata)} images across {len(weeks)} weeks")
+        weeks, image_count, undated = select_weekly_images(download_links)
+        for filename in undated:
+            console.print(f"[yellow]⚠️ Could not extract date from filename: {filename}[/yellow]")
+        console.print(f"[✅] Found {image_count} images across {len(weeks)} weeks")
         s3_path_prefix = f"planetscope analytic/four_bands/{aoi_name}"
+
+        jobs = []
         for week, img in weeks.items():
-            filename = img['filename']
             s3_key = f"{s3_path_prefix}/{img['date']}_{img['scene_id']}.tiff"
-            console.print(f"[⬆️] Uploading week {week} image: {filename} -> s3://{S3_BUCKET}/{s3_key}")
-            r = requests.get(img['url'], stream=True)
-            if r.status_code == 200:
-                try:
-                    s3.upload_fileobj(
-                        io.BytesIO(r.content),
-                        S3_BUCKET,
-                        s3_key
-                    )
-                    console.print(f"[✅] Successfully uploaded to S3: s3://{S3_BUCKET}/{s3_key}")
-                except Exception as e:
-                    console.print(f"[❌] Error uploading to S3: {str(e)}", style="bold red")
-            else:
-                console.print(f"[❌] Failed to download image: {r.status_code}", style="bold red")
+            if verbose:
+                console.print(f"[⬆️] Uploading week {week} image: {img['filename']} -> s3://{S3_BUCKET}/{s3_key}")
+            jobs.append((img['url'], s3_key))
+        run_transfers(jobs, verbose=verbose)
     elif is_basemap or order_type == "Basemap (Composite)":
         mosaic_parts = mosaic_name.split("_")
         if len(mosaic_parts) >= 4 and len(mosaic_parts[2]) == 4:
@@ -696,34 +994,25 @@ def check_order_status(order_id, api_key):
             mosaic_date = "unknown_date"
         s3_path_prefix = f"basemaps/{aoi_name}/{mosaic_date}"
         console.print(f"[⬆️] Uploading Basemap files to S3 path: s3://{S3_BUCKET}/{s3_path_prefix}")
+
+        jobs = []
         for link in download_links:
             filename = Path(link.get("name", "")).name
-            s3_key = f"{s3_path_prefix}/{filename}"
-            console.print(f"[⬆️] Downloading and uploading: {filename}")
-            r = requests.get(link.get('location'), stream=True)
-            if r.status_code == 200:
-                try:
-                    s3.upload_fileobj(
-                        io.BytesIO(r.content),
-                        S3_BUCKET,
-                        s3_key
-                    )
-                    console.print(f"[✅] Successfully uploaded to S3: s3://{S3_BUCKET}/{s3_key}")
-                except Exception as e:
-                    console.print(f"[❌] Error uploading to S3: {str(e)}", style="bold red")
-            else:
-                console.print(f"[❌] Failed to download file: {r.status_code}", style="bold red")
+            if verbose:
+                console.print(f"[⬆️] Downloading and uploading: {filename}")
+            jobs.append((link.get('location'), f"{s3_path_prefix}/{filename}"))
+        run_transfers(jobs, verbose=verbose)
     try:
-        metadata_json = json.dumps(order_info, indent=2)
         s3_metadata_path = ""
         if is_basemap or order_type == "Basemap (Composite)":
             s3_metadata_path = f"basemaps/{aoi_name}/{mosaic_date}/metadata.json"
         else:
             s3_metadata_path = f"planetscope analytic/four_bands/{aoi_name}/metadata.json"
-        s3.put_object(
-            Body=metadata_json,
+        get_s3_client().put_object(
+            Body=order_info_raw,
             Bucket=S3_BUCKET,
-            Key=s3_metadata_path
+            Key=s3_metadata_path,
+            ContentType="application/json"
         )
         console.print(f"[✅] Order metadata saved to S3: s3://{S3_BUCKET}/{s3_metadata_path}")
     except Exception as e:
@@ -732,16 +1021,182 @@ def check_order_status(order_id, api_key):
     console.print(f"[🎉] Order processing complete! All files uploaded to S3.", style="bold green")
 
 
+def check_batch_order(order: dict, api_key: str, overwrite: bool, use_s3: bool, local_output_dir: Path = None, verbose: bool = False) -> dict:
+    """
+    Check one batch order's status and plan its downloads.
+
+    Runs in a worker thread, so console lines are collected as (message, style)
+    pairs for the caller to print in batch order instead of interleaving.
+
+    Returns a dict with the results bucket ("success", "partial", "pending",
+    "failed", "cancelled" or "error"), the entry for that bucket, the lines,
+    and for ready orders the (url, target) transfer jobs plus where to save
+    the raw order response as metadata.json.
+    """
+    lines = []
+    log = lambda message, style=None: lines.append((message, style))
+    order_id = order.get("order_id")
+    aoi_name = order.get("aoi_name", "Unknown")
+
+    def outcome(bucket, entry, **extra):
+        return {"bucket": bucket, "entry": entry, "lines": lines, **extra}
+
+    # Check order status
+    try:
+        response = SESSION.get(f"https://api.planet.com/compute/ops/orders/v2/{order_id}", auth=(api_key, ""), timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        log(f"  [❌] Error checking order status: {e}", "bold red")
+        return outcome("error", {"order_id": order_id, "aoi_name": aoi_name, "error": str(e)})
+
+    if response.status_code != 200:
+        # Decode only the bytes shown rather than the whole (possibly large) error page
+        error_text = response.content[:100].decode("utf-8", "replace")
+        log(f"  [❌] Error checking order status: {error_text}", "bold red")
+        return outcome("error", {"order_id": order_id, "aoi_name": aoi_name, "error": error_text})
+
+    # Anything unexpected in the order body fails this order only, not the batch
+    try:
+        order_info = orjson.loads(response.content)
+        order_info_raw = response.content  # saved as-is as metadata.json
+        order_state = order_info["state"]
+        log(f"  [✅] Status: {order_state}")
+
+        # Handle different order states (Planet API: queued, running, success, partial, failed, cancelled)
+        is_partial = False
+        if order_state == "success":
+            pass  # Proceed to download
+        elif order_state == "partial":
+            is_partial = True
+            log(f"  [⚠️] Order is partial - some files may have failed. Downloading available files...")
+        elif order_state == "failed":
+            error_hints = order_info.get("error_hints", [])
+            error_msg = ', '.join(error_hints) if error_hints else "No details provided"
+            log(f"  [❌] Order failed permanently: {error_msg}")
+            return outcome("failed", {"order_id": order_id, "aoi_name": aoi_name, "error": error_msg})
+        elif order_state == "cancelled":
+            log(f"  [❌] Order was cancelled and will not be completed.")
+            return outcome("cancelled", {"order_id": order_id, "aoi_name": aoi_name})
+        elif order_state in ("queued", "running"):
+            log(f"  [⏳] Order is {order_state} - try again later.")
+            return outcome("pending", {"order_id": order_id, "aoi_name": aoi_name, "state": order_state})
+        else:
+            log(f"  [⏳] Unknown state: {order_state} - try again later.")
+            return outcome("pending", {"order_id": order_id, "aoi_name": aoi_name, "state": order_state})
+
+        # Order is ready (success or partial) - process it
+        aoi_name_normalized = normalize_aoi_name(order.get("aoi_name", "UnknownAOI"))
+        mosaic_name = order.get("mosaic_name", "unknown_mosaic")
+        order_type = order.get("order_type", "Unknown")
+        num_bands = order.get("num_bands", "four_bands")
+        
+        is_basemap = "source_type" in order_info and order_info["source_type"] == "basemaps"
+        
+        download_links = order_info["_links"].get("results", [])
+        if not download_links:
+            log("  [⚠️] No downloadable files found.")
+            return outcome("error", {"order_id": order_id, "aoi_name": aoi_name, "error": "No downloadable files"})
+        
+        # Plan the uploads/downloads (same layout as check_order_status)
+        jobs = []
+        if order_type == "PSScope" and num_bands == "four_bands":
+            log(f"  [🔍] Processing PSScope Order - Organizing by week...")
+            weeks, image_count, _ = select_weekly_images(download_links)
+            log(f"  [✅] Found {image_count} images across {len(weeks)} weeks")
+            
+            relative_path = f"planetscope analytic/four_bands/{aoi_name_normalized}"
+            existing_keys = (
+                list_existing_keys(S3_BUCKET, f"{relative_path}/")
+                if use_s3 and not overwrite else set()
+            )
+            
+            for week, img in weeks.items():
+                target_filename = f"{img['date']}_{img['scene_id']}.tiff"
+                
+                if use_s3:
+                    s3_key = f"{relative_path}/{target_filename}"
+                    # Check if file already exists in S3 (unless overwriting)
+                    if s3_key in existing_keys:
+                        log(f"  [⏭️] Skipping (exists): s3://{S3_BUCKET}/{s3_key}")
+                        continue
+                    if verbose:
+                        log(f"  [⬆️] Uploading: {img['filename']} -> s3://{S3_BUCKET}/{s3_key}")
+                    jobs.append((img['url'], s3_key))
+                else:
+                    local_path = local_output_dir / relative_path / target_filename
+                    # Check if file already exists locally (unless overwriting)
+                    if not overwrite and local_path.exists():
+                        log(f"  [⏭️] Skipping (exists): {local_path}")
+                        continue
+                    if verbose:
+                        log(f"  [⬇️] Downloading: {img['filename']} -> {local_path}")
+                    jobs.append((img['url'], local_path))
+
+        elif is_basemap or order_type == "Basemap (Composite)":
+            mosaic_parts = mosaic_name.split("_")
+            if len(mosaic_parts) >= 4 and len(mosaic_parts[2]) == 4:
+                mosaic_date = f"{mosaic_parts[2]}_{mosaic_parts[3]}"
+            else:
+                mosaic_date = "unknown_date"
+                
+            relative_path = f"basemaps/{aoi_name_normalized}/{mosaic_date}"
+            
+            if use_s3:
+                log(f"  [⬆️] Uploading Basemap files to s3://{S3_BUCKET}/{relative_path}")
+            else:
+                log(f"  [⬇️] Downloading Basemap files to {local_output_dir / relative_path}")
+            
+            existing_keys = (
+                list_existing_keys(S3_BUCKET, f"{relative_path}/")
+                if use_s3 and not overwrite else set()
+            )
+            
+            for link in download_links:
+                filename = Path(link.get("name", "")).name
+                
+                if use_s3:
+                    s3_key = f"{relative_path}/{filename}"
+                    # Check if file already exists in S3 (unless overwriting)
+                    if s3_key in existing_keys:
+                        log(f"  [⏭️] Skipping (exists): s3://{S3_BUCKET}/{s3_key}")
+                        continue
+                    if verbose:
+                        log(f"  [⬆️] Uploading: {filename}")
+                    jobs.append((link.get('location'), s3_key))
+                else:
+                    local_path = local_output_dir / relative_path / filename
+                    # Check if file already exists locally (unless overwriting)
+                    if not overwrite and local_path.exists():
+                        log(f"  [⏭️] Skipping (exists): {local_path}")
+                        continue
+                    if verbose:
+                        log(f"  [⬇️] Downloading: {filename}")
+                    jobs.append((link.get('location'), local_path))
+
+        if is_basemap or order_type == "Basemap (Composite)":
+            metadata_relative_path = f"basemaps/{aoi_name_normalized}/{mosaic_date}/metadata.json"
+        else:
+            metadata_relative_path = f"planetscope analytic/four_bands/{aoi_name_normalized}/metadata.json"
+    except Exception as e:
+        log(f"  [❌] Error processing order: {str(e)}", "bold red")
+        return outcome("error", {"order_id": order_id, "aoi_name": aoi_name, "error": str(e)})
+
+    return outcome(
+        "partial" if is_partial else "success", order,
+        jobs=jobs, metadata_path=metadata_relative_path, metadata=order_info_raw
+    )
+
+
 @cli.command()
 @click.argument("batch_id")
 @click.option("--api-key", default=os.getenv("PL_API_KEY"), help="Planet API Key")
 @click.option("--overwrite", is_flag=True, default=False, help="Re-download even if files already exist (default: skip existing files)")
 @click.option("--output", default="s3", help="Output location: 's3' (default) or local directory path")
-def batch_check_status(batch_id, api_key, overwrite, output):
+@click.option("--verbose", is_flag=True, default=False, help="List every file as it is queued and saved")
+def batch_check_status(batch_id, api_key, overwrite, output, verbose):
     """
     Check status and download all orders in a batch.
     
-    Finds all orders with the given batch_id from orders.json and processes each one.
+    Finds all orders with the given batch_id from orders.jsonl and processes each one.
     
     By default, files that already exist at the output location are skipped.
     Use --overwrite to re-download them.
@@ -758,24 +1213,27 @@ def batch_check_status(batch_id, api_key, overwrite, output):
         console.print(f"[red]Error: {ORDERS_LOG_FILE} not found.[/red]")
         return
     
+    # Stream the log once: collect this batch's orders and tally the others
+    batch_orders = []
+    batch_id_counts = Counter()
     try:
-        with ORDERS_LOG_FILE.open("r") as f:
-            orders = json.load(f)
-    except json.JSONDecodeError as e:
+        for o in iter_orders():
+            bid = o.get("batch_id")
+            if not bid:
+                continue
+            batch_id_counts[bid] += 1
+            if bid == batch_id:
+                batch_orders.append(o)
+    except orjson.JSONDecodeError as e:
         console.print(f"[red]Error reading {ORDERS_LOG_FILE}: {e}[/red]")
         return
     
-    # Find all orders with this batch_id
-    batch_orders = [o for o in orders if o.get("batch_id") == batch_id]
-    
     if not batch_orders:
         console.print(f"[yellow]No orders found with batch_id: {batch_id}[/yellow]")
-        console.print("[dim]Available batch_ids in orders.json:[/dim]")
-        batch_ids = set(o.get("batch_id") for o in orders if o.get("batch_id"))
-        if batch_ids:
-            for bid in sorted(batch_ids):
-                count = sum(1 for o in orders if o.get("batch_id") == bid)
-                console.print(f"  • {bid} ({count} orders)")
+        console.print(f"[dim]Available batch_ids in {ORDERS_LOG_FILE}:[/dim]")
+        if batch_id_counts:
+            for bid in sorted(batch_id_counts):
+                console.print(f"  • {bid} ({batch_id_counts[bid]} orders)")
         else:
             console.print("  (none found)")
         return
@@ -793,227 +1251,74 @@ def batch_check_status(batch_id, api_key, overwrite, output):
         "error": []          # API/processing errors on our side
     }
     
-    for i, order in enumerate(batch_orders, 1):
-        order_id = order.get("order_id")
+    use_s3 = output.lower() == "s3"
+    local_output_dir = None if use_s3 else Path(output)
+    
+    # Status checks and S3 listings are independent per order, so run them
+    # in parallel; each order's lines are printed afterwards in batch order
+    check = partial(
+        check_batch_order, api_key=api_key, overwrite=overwrite,
+        use_s3=use_s3, local_output_dir=local_output_dir, verbose=verbose
+    )
+    with ThreadPoolExecutor(max_workers=min(MAX_STATUS_WORKERS, len(batch_orders))) as pool:
+        checked = list(pool.map(check, batch_orders))
+    
+    ready = []
+    for i, (order, outcome) in enumerate(zip(batch_orders, checked), 1):
         aoi_name = order.get("aoi_name", "Unknown")
         start_date = order.get("start_date", "N/A")
         end_date = order.get("end_date", "N/A")
-        
         console.print(f"[{i}/{len(batch_orders)}] Checking {aoi_name} ({start_date} to {end_date})...")
-        console.print(f"  Order ID: {order_id}")
-        
-        # Check order status
-        response = requests.get(f"https://api.planet.com/compute/ops/orders/v2/{order_id}", auth=(api_key, ""))
-        
-        if response.status_code != 200:
-            console.print(f"  [❌] Error checking order status: {response.text[:100]}", style="bold red")
-            results["error"].append({"order_id": order_id, "aoi_name": aoi_name, "error": response.text[:100]})
-            continue
-        
-        order_info = response.json()
-        order_state = order_info["state"]
-        console.print(f"  [✅] Status: {order_state}")
-        
-        # Handle different order states (Planet API: queued, running, success, partial, failed, cancelled)
-        is_partial = False
-        if order_state == "success":
-            pass  # Proceed to download
-        elif order_state == "partial":
-            is_partial = True
-            console.print(f"  [⚠️] Order is partial - some files may have failed. Downloading available files...")
-        elif order_state == "failed":
-            error_hints = order_info.get("error_hints", [])
-            error_msg = ', '.join(error_hints) if error_hints else "No details provided"
-            console.print(f"  [❌] Order failed permanently: {error_msg}")
-            results["failed"].append({"order_id": order_id, "aoi_name": aoi_name, "error": error_msg})
-            continue
-        elif order_state == "cancelled":
-            console.print(f"  [❌] Order was cancelled and will not be completed.")
-            results["cancelled"].append({"order_id": order_id, "aoi_name": aoi_name})
-            continue
-        elif order_state in ("queued", "running"):
-            console.print(f"  [⏳] Order is {order_state} - try again later.")
-            results["pending"].append({"order_id": order_id, "aoi_name": aoi_name, "state": order_state})
-            continue
+        console.print(f"  Order ID: {order.get('order_id')}")
+        for message, style in outcome["lines"]:
+            console.print(message, style=style)
+        console.print()
+        if outcome["bucket"] in ("success", "partial"):
+            ready.append(outcome)
         else:
-            console.print(f"  [⏳] Unknown state: {order_state} - try again later.")
-            results["pending"].append({"order_id": order_id, "aoi_name": aoi_name, "state": order_state})
-            continue
-        
-        # Order is ready (success or partial) - process it
-        aoi_name_normalized = normalize_aoi_name(order.get("aoi_name", "UnknownAOI"))
-        mosaic_name = order.get("mosaic_name", "unknown_mosaic")
-        order_type = order.get("order_type", "Unknown")
-        num_bands = order.get("num_bands", "four_bands")
-        product_bundle = order.get("product_bundle")
-        
-        is_basemap = "source_type" in order_info and order_info["source_type"] == "basemaps"
-        
-        download_links = order_info["_links"].get("results", [])
-        if not download_links:
-            console.print("  [⚠️] No downloadable files found.")
-            results["error"].append({"order_id": order_id, "aoi_name": aoi_name, "error": "No downloadable files"})
-            continue
-        
-        # Determine output location
-        use_s3 = output.lower() == "s3"
-        if not use_s3:
-            local_output_dir = Path(output)
-            local_output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Process and upload/save files (same logic as check_order_status)
+            results[outcome["bucket"]].append(outcome["entry"])
+    
+    # One transfer pool for every ready order's files
+    jobs = [job for outcome in ready for job in outcome["jobs"]]
+    if not use_s3:
+        for dest_dir in {local_path.parent for _, local_path in jobs}:
+            dest_dir.mkdir(parents=True, exist_ok=True)
+    run_transfers(jobs, stream_to_s3 if use_s3 else stream_to_file, verbose)
+    
+    # Save metadata (the order response body, without re-serializing). Date
+    # chunks of one AOI share a metadata.json, so only the last order written
+    # to each key is saved, as when every order overwrote the previous one.
+    last_for_key = {outcome["metadata_path"]: i for i, outcome in enumerate(ready)}
+    for i, outcome in enumerate(ready):
+        order = outcome["entry"]
+        aoi_name = order.get("aoi_name", "Unknown")
         try:
-            if order_type == "PSScope" and num_bands == "four_bands":
-                console.print(f"  [🔍] Processing PSScope Order - Organizing by week...")
-                image_metadata = []
-                processed_filenames = set()
-                for link in download_links:
-                    filename = Path(link.get("name", "")).name
-                    if filename in processed_filenames:
-                        continue
-                    processed_filenames.add(filename)
-                    if not filename.lower().endswith('.tif') or 'udm' in filename.lower() or filename.lower().endswith('.xml'):
-                        continue
-                    date_str = extract_date_from_filename(filename)
-                    if not date_str:
-                        continue
-                    week_start = get_week_start_date(date_str)
-                    scene_id = extract_scene_id(filename) or "unknown"
-                    image_metadata.append({
-                        'filename': filename,
-                        'date': date_str,
-                        'week_start': week_start, 
-                        'scene_id': scene_id,
-                        'url': link.get('location'),
-                        'size': link.get('length', 0)
-                    })
-                weeks = {}
-                for img in sorted(image_metadata, key=lambda x: (x['week_start'], x['date'])):
-                    week = img['week_start']
-                    if week not in weeks:
-                        weeks[week] = img
-                console.print(f"  [✅] Found {len(image_metadata)} images across {len(weeks)} weeks")
-                
-                relative_path = f"planetscope analytic/four_bands/{aoi_name_normalized}"
-                
-                for week, img in weeks.items():
-                    target_filename = f"{img['date']}_{img['scene_id']}.tiff"
-                    
-                    if use_s3:
-                        s3_key = f"{relative_path}/{target_filename}"
-                        # Check if file already exists in S3 (unless overwriting)
-                        if not overwrite and s3_key_exists(S3_BUCKET, s3_key):
-                            console.print(f"  [⏭️] Skipping (exists): s3://{S3_BUCKET}/{s3_key}")
-                            continue
-                        console.print(f"  [⬆️] Uploading: {img['filename']} -> s3://{S3_BUCKET}/{s3_key}")
-                    else:
-                        local_path = local_output_dir / relative_path / target_filename
-                        # Check if file already exists locally (unless overwriting)
-                        if not overwrite and local_path.exists():
-                            console.print(f"  [⏭️] Skipping (exists): {local_path}")
-                            continue
-                        local_path.parent.mkdir(parents=True, exist_ok=True)
-                        console.print(f"  [⬇️] Downloading: {img['filename']} -> {local_path}")
-                    
-                    r = requests.get(img['url'], stream=True)
-                    if r.status_code == 200:
-                        try:
-                            if use_s3:
-                                s3.upload_fileobj(
-                                    io.BytesIO(r.content),
-                                    S3_BUCKET,
-                                    s3_key
-                                )
-                            else:
-                                with open(local_path, 'wb') as f:
-                                    f.write(r.content)
-                            console.print(f"  [✅] Saved successfully")
-                        except Exception as e:
-                            console.print(f"  [❌] Error saving: {str(e)}", style="bold red")
-                    else:
-                        console.print(f"  [❌] Failed to download: {r.status_code}", style="bold red")
-                        
-            elif is_basemap or order_type == "Basemap (Composite)":
-                mosaic_parts = mosaic_name.split("_")
-                if len(mosaic_parts) >= 4 and len(mosaic_parts[2]) == 4:
-                    mosaic_date = f"{mosaic_parts[2]}_{mosaic_parts[3]}"
-                else:
-                    mosaic_date = "unknown_date"
-                    
-                relative_path = f"basemaps/{aoi_name_normalized}/{mosaic_date}"
-                
-                if use_s3:
-                    console.print(f"  [⬆️] Uploading Basemap files to s3://{S3_BUCKET}/{relative_path}")
-                else:
-                    console.print(f"  [⬇️] Downloading Basemap files to {local_output_dir / relative_path}")
-                
-                for link in download_links:
-                    filename = Path(link.get("name", "")).name
-                    
-                    if use_s3:
-                        s3_key = f"{relative_path}/{filename}"
-                        # Check if file already exists in S3 (unless overwriting)
-                        if not overwrite and s3_key_exists(S3_BUCKET, s3_key):
-                            console.print(f"  [⏭️] Skipping (exists): s3://{S3_BUCKET}/{s3_key}")
-                            continue
-                        console.print(f"  [⬆️] Uploading: {filename}")
-                    else:
-                        local_path = local_output_dir / relative_path / filename
-                        # Check if file already exists locally (unless overwriting)
-                        if not overwrite and local_path.exists():
-                            console.print(f"  [⏭️] Skipping (exists): {local_path}")
-                            continue
-                        local_path.parent.mkdir(parents=True, exist_ok=True)
-                        console.print(f"  [⬇️] Downloading: {filename}")
-                    
-                    r = requests.get(link.get('location'), stream=True)
-                    if r.status_code == 200:
-                        try:
-                            if use_s3:
-                                s3.upload_fileobj(
-                                    io.BytesIO(r.content),
-                                    S3_BUCKET,
-                                    s3_key
-                                )
-                            else:
-                                with open(local_path, 'wb') as f:
-                                    f.write(r.content)
-                            console.print(f"  [✅] Saved successfully")
-                        except Exception as e:
-                            console.print(f"  [❌] Error saving: {str(e)}", style="bold red")
-                    else:
-                        console.print(f"  [❌] Failed to download: {r.status_code}", style="bold red")
-            
-            # Save metadata
-            metadata_json = json.dumps(order_info, indent=2)
-            if is_basemap or order_type == "Basemap (Composite)":
-                metadata_relative_path = f"basemaps/{aoi_name_normalized}/{mosaic_date}/metadata.json"
-            else:
-                metadata_relative_path = f"planetscope analytic/four_bands/{aoi_name_normalized}/metadata.json"
-            
-            if use_s3:
-                s3.put_object(
-                    Body=metadata_json,
+            if last_for_key[outcome["metadata_path"]] != i:
+                pass  # superseded by a later order for the same AOI
+            elif use_s3:
+                get_s3_client().put_object(
+                    Body=outcome["metadata"],
                     Bucket=S3_BUCKET,
-                    Key=metadata_relative_path
+                    Key=outcome["metadata_path"],
+                    ContentType="application/json"
                 )
-                console.print(f"  [✅] Metadata saved to S3")
+                console.print(f"[✅] Metadata saved to S3 for {aoi_name}")
             else:
-                metadata_local_path = local_output_dir / metadata_relative_path
+                metadata_local_path = local_output_dir / outcome["metadata_path"]
                 metadata_local_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(metadata_local_path, 'w') as f:
-                    f.write(metadata_json)
-                console.print(f"  [✅] Metadata saved locally")
-            
-            if is_partial:
-                console.print(f"  [⚠️] Partial order downloaded (some files may be missing)!\n")
-                results["partial"].append(order)
-            else:
-                console.print(f"  [🎉] Order complete!\n")
-                results["success"].append(order)
+                with open(metadata_local_path, 'wb') as f:
+                    f.write(outcome["metadata"])
+                console.print(f"[✅] Metadata saved locally for {aoi_name}")
         except Exception as e:
-            console.print(f"  [❌] Error processing order: {str(e)}", style="bold red")
-            results["error"].append({"order_id": order_id, "aoi_name": aoi_name, "error": str(e)})
+            console.print(f"[❌] Error processing order {aoi_name}: {str(e)}", style="bold red")
+            results["error"].append({"order_id": order.get("order_id"), "aoi_name": aoi_name, "error": str(e)})
+            continue
+        
+        if outcome["bucket"] == "partial":
+            console.print(f"[⚠️] Partial order downloaded for {aoi_name} (some files may be missing)!")
+        else:
+            console.print(f"[🎉] Order complete for {aoi_name}!")
+        results[outcome["bucket"]].append(order)
     
     # Summary
     console.print("\n" + "="*60)
@@ -1067,19 +1372,18 @@ def batch_check_status(batch_id, api_key, overwrite, output):
 @click.option("--bundle", default=None, help="Override bundle name to use")
 @click.option("--cadence", type=click.Choice(["daily", "weekly", "monthly"]), default="weekly", help="Scene selection cadence")
 @click.option("--api-key", default=os.getenv("PL_API_KEY"), help="Planet API Key")
-def search_scenes(geojson, start_date, end_date, num_bands, bundle, cadence, api_key):
-    gdf = gpd.read_file(geojson)
-    gdf = gdf.to_crs(epsg=4326)
-    aoi_geom = gdf.geometry.union_all()
+@click.option("--no-cache", is_flag=True, default=False, help="Ignore cached search results and query Planet again")
+def search_scenes(geojson, start_date, end_date, num_bands, bundle, cadence, api_key, no_cache):
+    try:
+        aoi_geom = load_aoi(geojson)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        return
 
-    gdf_equal_area = gdf.to_crs(epsg=6933)  # World Cylindrical Equal Area
-    # Compute area in sq km using equal-area CRS
-    aoi_area_sqkm = gdf_equal_area.area.sum() / 1e6  # m² → km²
+    # Geodesic area of the dissolved AOI; overlapping parts are not double counted
+    aoi_area_sqkm = compute_area_sqkm(aoi_geom)
     console.print(f"[✓] AOI area: {aoi_area_sqkm:.2f} sq km", style="bold blue")
 
-    start_iso = f"{start_date}T00:00:00Z"
-    end_iso = f"{end_date}T23:59:59Z"
-
     start_year = int(start_date.split('-')[0])
 
     if bundle:
@@ -1092,26 +1396,9 @@ def search_scenes(geojson, start_date, end_date, num_bands, bundle, cadence, api
         product_bundle = "ortho_analytic_8b_sr" if start_year >= 2021 else "analytic_sr_udm2"
         console.print(f"[✅] Using 8-band surface reflectance: {product_bundle}", style="bold blue")
 
-    payload = {
-        "item_types": ["PSScene"],
-        "filter": {
-            "type": "AndFilter",
-            "config": [
-                {"type": "GeometryFilter", "field_name": "geometry", "config": aoi_geom.__geo_interface__},
-                {"type": "DateRangeFilter", "field_name": "acquired", "config": {"gte": start_iso, "lte": end_iso}},
-                {"type": "RangeFilter", "field_name": "cloud_cover", "config": {"lte": 0.0}},
-                {"type": "AssetFilter", "config": [product_bundle]},
-                {"type":"StringInFilter", "field_name":"quality_category", "config":["standard"]}
-            ]
-        }
-    }
-
-    search_url = "https://api.planet.com/data/v1/quick-search"
-    search_headers = {"Content-Type": "application/json"}
-    
     # Fetch all results with pagination
     try:
-        features = fetch_all_search_results(search_url, payload, api_key, search_headers)
+        features = planet_quick_search(aoi_geom.__geo_interface__, start_date, end_date, product_bundle, api_key, use_cache=not no_cache)
     except Exception as e:
         console.print(f"[red]Search failed: {str(e)}[/red]")
         return
@@ -1122,43 +1409,12 @@ def search_scenes(geojson, start_date, end_date, num_bands, bundle, cadence, api
     
     console.print(f"[✓] Found {len(features)} scenes matching initial criteria.", style="bold blue")
 
-    def get_interval_key(date_obj):
-        if cadence == "daily":
-            return date_obj.strftime("%Y-%m-%d")
-        elif cadence == "weekly":
-            sunday = date_obj - timedelta(days=date_obj.weekday() + 1 if date_obj.weekday() != 6 else 0)
-            return sunday.strftime("%Y-%m-%d")
-        elif cadence == "monthly":
-            return date_obj.strftime("%Y-%m")
-
-    scene_groups = defaultdict(list)
-    for f in features:
-        props = f["properties"]
-        geom = shape(f["geometry"])
-        fid = f["id"]
-        intersect_area = geom.intersection(aoi_geom).area
-        coverage_pct = (intersect_area / aoi_geom.area) * 100
-        if coverage_pct < MIN_COV_PCT:
-            console.print(f"[dim]Skipping {fid}: only {coverage_pct:.2f}% coverage[/dim]")
-            continue
-
-        date = datetime.strptime(props["acquired"][:10], "%Y-%m-%d")
-        key = get_interval_key(date)
-        scene_groups[key].append((coverage_pct, date, f))
-
-        # Sort each group by coverage descending, then date ascending; select first
-        selected = []
-        for group in scene_groups.values():
-            group.sort(key=lambda x: (-x[0], x[1]))  # coverage desc, date asc
-            coverage_pct, date, f = group[0]
-            selected.append((f, coverage_pct, date))
-
-
+    selected = select_best_scenes(features, aoi_geom, cadence, log_skipped=True)
 
     console.print(f"[green]Selected {len(selected)} best scenes ({cadence})[/green]")
     for f, cov, dt in selected:
         thumb = f["_links"].get("thumbnail")
-        console.print(f"{dt.date()} | ID: {f['id']} | Coverage: {cov:.2f}% | [link={thumb}]thumbnail[/link]")
+        console.print(f"{dt} | ID: {f['id']} | Coverage: {cov:.2f}% | [link={thumb}]thumbnail[/link]")
 
     # Print the total sqkm covered by this order and ask the user if they want to proceed
     console.print(f"[blue]Total quota used in this order: {aoi_area_sqkm * len(selected):.2f} sq km[/blue]")
@@ -1178,7 +1434,10 @@ def search_scenes(geojson, start_date, end_date, num_bands, bundle, cadence, api
 @click.option("--cadence", type=click.Choice(["daily", "weekly", "monthly"]), default="weekly", help="Scene selection cadence")
 @click.option("--max-months", default=6, type=int, help="Maximum months per order chunk (default: 6)")
 @click.option("--dry-run", is_flag=True, help="Preview orders without submitting")
-def batch_submit(shp, gage_id_col, start_date_col, end_date_col, num_bands, api_key, bundle, cadence, max_months, dry_run):
+@click.option("--verbose", is_flag=True, default=False, help="Print a line for every order, not just failed ones")
+@click.option("--concurrency", default=MAX_ORDER_WORKERS, type=click.IntRange(min=1), help=f"Orders searched/submitted in parallel (default: {MAX_ORDER_WORKERS})")
+@click.option("--no-cache", is_flag=True, default=False, help="Ignore cached search results and query Planet again")
+def batch_submit(shp, gage_id_col, start_date_col, end_date_col, num_bands, api_key, bundle, cadence, max_months, dry_run, verbose, concurrency, no_cache):
     """
     Submit multiple PlanetScope orders from a shapefile.
     
@@ -1195,12 +1454,12 @@ def batch_submit(shp, gage_id_col, start_date_col, end_date_col, num_bands, api_
         return
     
     try:
+        import geopandas as gpd
+        import pandas as pd
+
         # Read shapefile
         gdf = gpd.read_file(shp)
         gdf = gdf.to_crs(epsg=4326)
-        original_crs = gdf.crs
-        # Prepare equal-area CRS for accurate area calculations
-        equal_area_crs = "EPSG:6933"
 
         console.print(f"[bold blue]📂 Loaded shapefile with {len(gdf)} features[/bold blue]")
         console.print(f"[dim]Columns: {', '.join(gdf.columns.tolist())}[/dim]")
@@ -1213,43 +1472,57 @@ def batch_submit(shp, gage_id_col, start_date_col, end_date_col, num_bands, api_
             console.print(f"[yellow]Available columns: {gdf.columns.tolist()}[/yellow]")
             return
         
-        # Prepare orders
+        # Pull each column out once; dates are validated for the whole frame and
+        # each gage's area is computed once, not per date chunk
+        gage_ids = gdf[gage_id_col].astype(str).to_numpy()
+        start_dates = pd.to_datetime(gdf[start_date_col].astype(str).str.strip(), format="%Y-%m-%d", errors="coerce")
+        end_dates = pd.to_datetime(gdf[end_date_col].astype(str).str.strip(), format="%Y-%m-%d", errors="coerce")
+        valid = (start_dates.notna() & end_dates.notna()).to_numpy()
+        areas_sqkm = np.array([compute_area_sqkm(geom) for geom in gdf.geometry])
+
+        for gage_id, start, end in zip(gage_ids[~valid], gdf[start_date_col][~valid], gdf[end_date_col][~valid]):
+            console.print(f"[yellow]⚠️ Skipping {gage_id}: Invalid date format ({start} / {end}, expected YYYY-MM-DD)[/yellow]")
+
+        # Prepare orders, skipping repeated (gage, date chunk) pairs so a gage
+        # listed twice in the shapefile isn't ordered (and billed) twice
         all_orders = []
-        for idx, row in gdf.iterrows():
-            gage_id = str(row[gage_id_col])
-            start_date = str(row[start_date_col])
-            end_date = str(row[end_date_col])
-            
-            # Parse dates - handle various formats
-            try:
-                # Try parsing to validate dates
-                start_dt = datetime.strptime(start_date.strip(), "%Y-%m-%d")
-                end_dt = datetime.strptime(end_date.strip(), "%Y-%m-%d")
-                start_date = start_dt.strftime("%Y-%m-%d")
-                end_date = end_dt.strftime("%Y-%m-%d")
-            except ValueError as e:
-                console.print(f"[yellow]⚠️ Skipping {gage_id}: Invalid date format ({e})[/yellow]")
-                continue
-            
+        seen_orders = set()
+        duplicate_orders = 0
+        for idx, gage_id, start_date, end_date, geom, area_sqkm in zip(
+            gdf.index[valid],
+            gage_ids[valid],
+            start_dates[valid].dt.strftime("%Y-%m-%d"),
+            end_dates[valid].dt.strftime("%Y-%m-%d"),
+            gdf.geometry.to_numpy()[valid],
+            areas_sqkm[valid]
+        ):
             # Subdivide if needed
             date_chunks = subdivide_date_range(start_date, end_date, max_months)
+            # Serialized once per gage and shared by all of its date chunks
+            aoi_geojson = geom.__geo_interface__
             
             for chunk_start, chunk_end in date_chunks:
+                if (gage_id, chunk_start, chunk_end) in seen_orders:
+                    duplicate_orders += 1
+                    continue
+                seen_orders.add((gage_id, chunk_start, chunk_end))
                 all_orders.append({
                     "gage_id": gage_id,
                     "start_date": chunk_start,
                     "end_date": chunk_end,
-                    "geometry": row.geometry,
+                    "geometry": geom,
+                    "aoi_geojson": aoi_geojson,
+                    "aoi_area_sqkm": area_sqkm,
                     "row_idx": idx
                 })
         
         console.print(f"\n[bold green]📋 Prepared {len(all_orders)} orders from {len(gdf)} gages[/bold green]")
+        if duplicate_orders:
+            console.print(f"[yellow]⚠️ Skipped {duplicate_orders} duplicate orders (same gage and date range)[/yellow]")
         
         # Show order summary
         console.print("\n[bold]Order Summary:[/bold]")
-        gage_order_counts = defaultdict(int)
-        for order in all_orders:
-            gage_order_counts[order["gage_id"]] += 1
+        gage_order_counts = Counter(order["gage_id"] for order in all_orders)
         
         for gage_id, count in gage_order_counts.items():
             if count > 1:
@@ -1275,7 +1548,8 @@ def batch_submit(shp, gage_id_col, start_date_col, end_date_col, num_bands, api_
         else:
             # For 8-band, use the earliest year to determine bundle
             #TODO: Fix handling of 8-band data to return error if user requests 8-band but dates are before 2021
-            earliest_year = min(int(o["start_date"].split('-')[0]) for o in all_orders)
+            # Start dates are normalized YYYY-MM-DD, so the smallest string is the earliest date
+            earliest_year = int(min(o["start_date"] for o in all_orders)[:4])
             product_bundle = "ortho_analytic_8b_sr" if earliest_year >= 2021 else "ortho_analytic_4b_sr"
             console.print(f"\n[✅] Using 8-band surface reflectance: {product_bundle}")
 
@@ -1295,54 +1569,73 @@ def batch_submit(shp, gage_id_col, start_date_col, end_date_col, num_bands, api_
         }
         
         console.print("\n[bold]Processing orders...[/bold]\n")
-        
-        for i, order in enumerate(all_orders, 1):
-            gage_id = order["gage_id"]
-            start_date = order["start_date"]
-            end_date = order["end_date"]
-            geom = order["geometry"]
-            
-            console.print(f"[{i}/{len(all_orders)}] {gage_id}: {start_date} to {end_date}...", end=" ")
-            
-            # Prepare geometry
-            aoi_geom = geom
-            aoi_geojson = aoi_geom.__geo_interface__
-            
-            geom_equal_area = gpd.GeoSeries([geom], crs=original_crs).to_crs(equal_area_crs)
-            aoi_area_sqkm = geom_equal_area.area.iloc[0] / 1e6  # m² → km²
 
-            
-            result = submit_single_order(
-                aoi_geom=aoi_geom,
-                aoi_geojson=aoi_geojson,
-                aoi_area_sqkm=aoi_area_sqkm,
-                start_date=start_date,
-                end_date=end_date,
-                gage_id=gage_id,
-                num_bands=num_bands,
-                product_bundle=product_bundle,
-                product_bundle_order=product_bundle_order,
-                cadence=cadence,
-                api_key=api_key,
-                dry_run=dry_run,
-                batch_id=batch_id
-            )
-            
-            if result.get("success"):
-                scenes_found = result.get('scenes_found', 0)
-                scenes_selected = result.get('scenes_selected', 0)
-                quota_ha = result.get('quota_hectares', 0)
-                if dry_run:
-                    console.print(f"[green]✓ Would submit ({scenes_found} found, {scenes_selected} selected, {quota_ha:,.0f} ha quota)[/green]")
+        # Arguments shared by every order in the batch are bound once
+        submit_order = partial(
+            submit_single_order,
+            num_bands=num_bands,
+            product_bundle=product_bundle,
+            product_bundle_order=product_bundle_order,
+            cadence=cadence,
+            api_key=api_key,
+            dry_run=dry_run,
+            batch_id=batch_id,
+            use_cache=not no_cache
+        )
+
+        # Searches and order POSTs are network-bound, so overlap them across a
+        # pool and report each order as soon as it finishes
+        with Progress(
+            TextColumn("[bold blue]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=console
+        ) as progress, ThreadPoolExecutor(max_workers=concurrency) as pool:
+            task = progress.add_task("Submitting" if not dry_run else "Searching", total=len(all_orders))
+            futures = {
+                pool.submit(
+                    submit_order,
+                    aoi_geom=order["geometry"],
+                    aoi_geojson=order["aoi_geojson"],
+                    aoi_area_sqkm=order["aoi_area_sqkm"],
+                    start_date=order["start_date"],
+                    end_date=order["end_date"],
+                    gage_id=order["gage_id"]
+                ): order
+                for order in all_orders
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                order = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # One order's unexpected error must not abort the batch summary
+                    result = {"success": False, "error": str(e)}
+                error = result.get("error", "")
+                # Only what the summary prints, not the order's geometry/GeoJSON
+                outcome = {"gage_id": order["gage_id"], "start_date": order["start_date"], "end_date": order["end_date"], "error": result.get("error", "Unknown")}
+                prefix = f"[{i}/{len(all_orders)}] {order['gage_id']}: {order['start_date']} to {order['end_date']}..."
+
+                # Failures are reported as they happen; everything else is in
+                # the progress bar and summary unless --verbose is given
+                if result.get("success"):
+                    scenes_found = result.get('scenes_found', 0)
+                    scenes_selected = result.get('scenes_selected', 0)
+                    quota_ha = result.get('quota_hectares', 0)
+                    if verbose and dry_run:
+                        console.print(f"{prefix} [green]✓ Would submit ({scenes_found} found, {scenes_selected} selected, {quota_ha:,.0f} ha quota)[/green]")
+                    elif verbose:
+                        console.print(f"{prefix} [green]✓ Order {result['order_id'][:8]}... ({scenes_found} found, {scenes_selected} selected, {quota_ha:,.0f} ha quota)[/green]")
+                    results["submitted"].append(result)
+                elif NO_SCENES_RE.search(error):
+                    if verbose:
+                        console.print(f"{prefix} [yellow]⚠ No valid scenes[/yellow]")
+                    results["no_scenes"].append(outcome)
                 else:
-                    console.print(f"[green]✓ Order {result['order_id'][:8]}... ({scenes_found} found, {scenes_selected} selected, {quota_ha:,.0f} ha quota)[/green]")
-                results["submitted"].append(result)
-            elif "No cloud-free" in result.get("error", "") or "No full-coverage" in result.get("error", ""):
-                console.print(f"[yellow]⚠ No valid scenes[/yellow]")
-                results["no_scenes"].append({**order, **result})
-            else:
-                console.print(f"[red]✗ {result.get('error', 'Unknown error')[:50]}...[/red]")
-                results["failed"].append({**order, **result})
+                    console.print(f"{prefix} [red]✗ {(error or 'Unknown error')[:50]}...[/red]")
+                    results["failed"].append(outcome)
+                progress.advance(task)
         
         # Summary
         console.print("\n" + "="*60)
@@ -1393,27 +1686,31 @@ def list_basemaps(start_date, end_date, api_key):
         console.print("[red]Error: API key is missing.[/red]")
         return
 
-    url = "https://api.planet.com/basemaps/v1/mosaics"
-    all_mosaics = []
-
-    while url:
-        response = requests.get(url, auth=(api_key, ""))
-        if response.status_code != 200:
-            console.print(f"[red]Error fetching basemaps: {response.text}[/red]")
-            return
-
-        data = response.json()
-        mosaics = data.get("mosaics", [])
-        all_mosaics.extend(mosaics)
-
-        url = data["_links"].get("_next") if "_links" in data else None
-
-    console.print(f"[cyan]Total basemaps found: {len(all_mosaics)}[/cyan]")
+    total_mosaics = 0
+    filtered_mosaics = []
+
+    # Request large pages and fetch page N+1 in the background while page N is consumed
+    with ThreadPoolExecutor(max_workers=1) as prefetch:
+        future = prefetch.submit(SESSION.get, API_URL, params={"_page_size": BASEMAPS_PAGE_SIZE}, auth=(api_key, ""), timeout=REQUEST_TIMEOUT)
+        while future:
+            response = future.result()
+            if response.status_code != 200:
+                console.print(f"[red]Error fetching basemaps: {response.text}[/red]")
+                return
+
+            data = orjson.loads(response.content)
+            next_url = data["_links"].get("_next") if "_links" in data else None
+            future = prefetch.submit(SESSION.get, next_url, auth=(api_key, ""), timeout=REQUEST_TIMEOUT) if next_url else None
+
+            # Filter each page as it arrives and keep only the matches
+            mosaics = data.get("mosaics", [])
+            total_mosaics += len(mosaics)
+            filtered_mosaics.extend(
+                m for m in mosaics
+                if start_date <= m["first_acquired"][:10] <= end_date
+            )
 
-    filtered_mosaics = [
-        m for m in all_mosaics
-        if start_date <= m["first_acquired"][:10] <= end_date
-    ]
+    console.print(f"[cyan]Total basemaps found: {total_mosaics}[/cyan]")
     console.print(f"[blue]Basemaps count after filtering: {len(filtered_mosaics)}[/blue]")
     if not filtered_mosaics:
         console.print("[yellow]No matching basemaps found.[/yellow]")